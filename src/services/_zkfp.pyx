@@ -0,0 +1,71 @@
+# cython: language_level=3
+"""Optional Cython fast path for the ZKTeco SDK hot calls.
+
+Build in this directory with:
+
+    python setup_zkfp.py build_ext --inplace
+
+Links directly against libzkfp, so the per-call overhead of ctypes
+(argtype parsing, argument boxing) disappears. zkTecoFingerprintBridge
+imports this module when present and falls back to ctypes otherwise.
+"""
+
+cdef extern from *:
+    """
+    extern int ZKFPM_AcquireFingerprint(void* hDevice,
+                                        unsigned char* fpImage,
+                                        unsigned int cbFPImage,
+                                        unsigned char* fpTemplate,
+                                        unsigned int* cbTemplate);
+    extern int ZKFPM_DBMatch(void* hDBCache,
+                             unsigned char* template1,
+                             unsigned int cbTemplate1,
+                             unsigned char* template2,
+                             unsigned int cbTemplate2);
+    """
+    int ZKFPM_AcquireFingerprint(void* hDevice,
+                                 unsigned char* fpImage,
+                                 unsigned int cbFPImage,
+                                 unsigned char* fpTemplate,
+                                 unsigned int* cbTemplate) nogil
+    int ZKFPM_DBMatch(void* hDBCache,
+                      unsigned char* template1,
+                      unsigned int cbTemplate1,
+                      unsigned char* template2,
+                      unsigned int cbTemplate2) nogil
+
+DEF MAX_IMAGE_SIZE = 320 * 480
+DEF MAX_TEMPLATE_SIZE = 2048
+
+
+def acquire_fingerprint(size_t device_handle):
+    """Capture one fingerprint template.
+
+    Returns the template bytes, or the (negative) SDK error code on
+    failure. Buffers live on the C stack - no Python allocation until
+    the final bytes slice.
+    """
+    cdef unsigned char img_buf[MAX_IMAGE_SIZE]
+    cdef unsigned char tpl_buf[MAX_TEMPLATE_SIZE]
+    cdef unsigned int tpl_len = MAX_TEMPLATE_SIZE
+    cdef int ret
+
+    with nogil:
+        ret = ZKFPM_AcquireFingerprint(<void*>device_handle, img_buf,
+                                       MAX_IMAGE_SIZE, tpl_buf, &tpl_len)
+    if ret != 0:
+        return ret
+    return tpl_buf[:tpl_len]
+
+
+def db_match(size_t db_handle, bytes stored, bytes captured):
+    """Match two templates; returns the SDK similarity score."""
+    cdef unsigned char* s = stored
+    cdef unsigned char* c = captured
+    cdef unsigned int s_len = len(stored)
+    cdef unsigned int c_len = len(captured)
+    cdef int similarity
+
+    with nogil:
+        similarity = ZKFPM_DBMatch(<void*>db_handle, s, s_len, c, c_len)
+    return similarity
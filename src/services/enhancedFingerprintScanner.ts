@@ -6,7 +6,7 @@
  */
 
 import { logger } from '../utils/logger';
-import { spawn } from 'child_process';
+import { spawn, ChildProcess } from 'child_process';
 import path from 'path';
 
 // Load native SDK wrapper if available
@@ -54,53 +54,117 @@ export class EnhancedFingerprintScanner {
   private SIMILARITY_THRESHOLD = 60; // SDK threshold for match
   private MAX_SAMPLES = 3;
   private usePythonBridge: boolean = false;
+  private bridgeProcess: ChildProcess | null = null;
+  private bridgePending: Array<{
+    resolve: (value: any) => void;
+    reject: (err: Error) => void;
+    timer: NodeJS.Timeout;
+  }> = [];
+  private bridgeStdoutBuffer: string = '';
 
   constructor() {
     this.initialize();
   }
 
   /**
-   * Call Python bridge for fingerprint operations
+   * Spawn the Python bridge daemon once and keep it alive.
+   * The daemon loads the SDK and opens the device a single time, so
+   * per-request cost is just a JSON line over the pipe instead of a
+   * full process spawn + DLL load + device open.
    */
-  private async callPythonBridge(operation: string, payload: any = {}): Promise<any> {
-    return new Promise((resolve, reject) => {
-      const scriptPath = path.join(__dirname, 'zkTecoFingerprintBridge.py');
-      const args = [operation, JSON.stringify(payload)];
+  private ensureBridgeProcess(): ChildProcess {
+    if (this.bridgeProcess && !this.bridgeProcess.killed) {
+      return this.bridgeProcess;
+    }
 
-      const process = spawn('python3', [scriptPath, ...args], {
-        cwd: __dirname,
-        timeout: 30000, // 30 second timeout
-      });
+    const scriptPath = path.join(__dirname, 'zkTecoFingerprintBridge.py');
+    const child = spawn('python3', [scriptPath, 'daemon'], {
+      cwd: __dirname,
+    });
+    this.bridgeStdoutBuffer = '';
 
-      let stdout = '';
-      let stderr = '';
+    child.stdout?.on('data', (data) => {
+      // Ignore late output from a daemon we already gave up on
+      if (this.bridgeProcess !== child) return;
 
-      process.stdout?.on('data', (data) => {
-        stdout += data.toString();
-      });
+      this.bridgeStdoutBuffer += data.toString();
 
-      process.stderr?.on('data', (data) => {
-        stderr += data.toString();
-        console.log('[ZKTeco Python]', data.toString());
-      });
+      // Responses are newline-delimited JSON, one per request, in order
+      let newlineIndex;
+      while ((newlineIndex = this.bridgeStdoutBuffer.indexOf('\n')) >= 0) {
+        const line = this.bridgeStdoutBuffer.slice(0, newlineIndex).trim();
+        this.bridgeStdoutBuffer = this.bridgeStdoutBuffer.slice(newlineIndex + 1);
+        if (!line) continue;
 
-      process.on('close', (code) => {
-        if (code !== 0) {
-          reject(new Error(`Python process exited with code ${code}: ${stderr}`));
-          return;
-        }
+        const pending = this.bridgePending.shift();
+        if (!pending) continue;
 
+        clearTimeout(pending.timer);
         try {
-          const result = JSON.parse(stdout);
-          resolve(result);
+          pending.resolve(JSON.parse(line));
         } catch (e) {
-          reject(new Error(`Failed to parse Python response: ${stdout}`));
+          pending.reject(new Error(`Failed to parse Python response: ${line}`));
         }
-      });
+      }
+    });
+
+    child.stderr?.on('data', (data) => {
+      console.log('[ZKTeco Python]', data.toString());
+    });
+
+    child.on('close', (code) => {
+      if (this.bridgeProcess !== child) return;
+      logger.warn(`Python bridge daemon exited with code ${code}`);
+      this.bridgeProcess = null;
+      this.failPendingBridgeRequests(new Error(`Python bridge exited with code ${code}`));
+    });
+
+    child.on('error', (err) => {
+      if (this.bridgeProcess !== child) return;
+      this.bridgeProcess = null;
+      this.failPendingBridgeRequests(err);
+    });
 
-      process.on('error', (err) => {
+    this.bridgeProcess = child;
+    return child;
+  }
+
+  private failPendingBridgeRequests(err: Error) {
+    const pending = this.bridgePending;
+    this.bridgePending = [];
+    for (const p of pending) {
+      clearTimeout(p.timer);
+      p.reject(err);
+    }
+  }
+
+  /**
+   * Call Python bridge for fingerprint operations
+   */
+  private async callPythonBridge(operation: string, payload: any = {}): Promise<any> {
+    return new Promise((resolve, reject) => {
+      let child: ChildProcess;
+      try {
+        child = this.ensureBridgeProcess();
+      } catch (err: any) {
         reject(err);
-      });
+        return;
+      }
+
+      const timer = setTimeout(() => {
+        // The daemon will still write this request's response line
+        // eventually (captures block on finger placement), so dropping
+        // just this entry would desync every later request/response
+        // pair. Restart the daemon instead, failing all pendings.
+        logger.warn(`Python bridge request timed out: ${operation} - restarting daemon`);
+        const timedOutChild = this.bridgeProcess;
+        this.bridgeProcess = null;
+        this.failPendingBridgeRequests(new Error(`Python bridge request timed out: ${operation}`));
+        timedOutChild?.kill();
+      }, 30000); // 30 second timeout
+
+      this.bridgePending.push({ resolve, reject, timer });
+      child.stdin?.write(JSON.stringify({ type: operation, payload }) + '\n');
     });
   }
 
@@ -354,6 +418,11 @@ export class EnhancedFingerprintScanner {
         zkScanner.closeDevice();
         zkScanner.terminate();
       }
+      if (this.bridgeProcess) {
+        this.bridgeProcess.stdin?.end();
+        this.bridgeProcess.kill();
+        this.bridgeProcess = null;
+      }
       this.isConnected = false;
       logger.info('Scanner disconnected');
     } catch (error: any) {
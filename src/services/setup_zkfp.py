@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+"""Build script for the optional _zkfp Cython extension.
+
+Usage (requires Cython and the ZKTeco SDK import library):
+
+    python setup_zkfp.py build_ext --inplace
+
+The resulting _zkfp module is picked up automatically by
+zkTecoFingerprintBridge.py; without it the bridge uses ctypes.
+"""
+
+import sys
+
+from setuptools import Extension, setup
+from Cython.Build import cythonize
+
+setup(
+    name='_zkfp',
+    ext_modules=cythonize([
+        Extension(
+            '_zkfp',
+            ['_zkfp.pyx'],
+            libraries=['libzkfp' if sys.platform == 'win32' else 'zkfp'],
+        ),
+    ]),
+)
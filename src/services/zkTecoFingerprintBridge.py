@@ -5,13 +5,156 @@ Provides a Python interface to the ZKTeco SDK via ctypes
 This avoids the need for Node.js native modules that require compilation
 """
 
+import atexit
 import ctypes
+import logging
 import os
 import sys
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import base64
+from binascii import b2a_base64
+
+log = logging.getLogger('zkteco')
+
+# Optional compiled fast path (see _zkfp.pyx / setup_zkfp.py); the
+# ctypes implementation below is the portable fallback
+try:
+    import _zkfp as _native
+except ImportError:
+    _native = None
+
+# orjson (when installed) serializes roughly 10x faster than the stdlib;
+# both sides of the pipe speak plain UTF-8 JSON either way
+try:
+    import orjson
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _loads(data):
+        return orjson.loads(data)
+except ImportError:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj).encode()
+
+    def _loads(data):
+        return json.loads(data)
+
+# Module-level DLL cache: the library is loaded (and its prototypes
+# bound) once per process, no matter how many scanners are constructed
+_LIB = None
+_LIB_PATH = None
+_FUNCS: Dict[str, object] = {}
+
+# Per-path load failures are only printed when debugging; they otherwise
+# spam Node.js's stderr pipe on every process start
+_DEBUG = bool(os.environ.get('ZKTECO_DEBUG'))
+
+# SDK function prototypes: (name, restype, argtypes)
+_PROTOTYPES = [
+    ('ZKFPM_Init', ctypes.c_int, []),
+    ('ZKFPM_DBInit', ctypes.c_void_p, []),
+    ('ZKFPM_GetDeviceCount', ctypes.c_int, []),
+    ('ZKFPM_OpenDevice', ctypes.c_void_p, [ctypes.c_int]),
+    ('ZKFPM_CloseDevice', ctypes.c_int, [ctypes.c_void_p]),
+    ('ZKFPM_Terminate', ctypes.c_int, []),
+    ('ZKFPM_DBFree', ctypes.c_int, [ctypes.c_void_p]),
+    ('ZKFPM_AcquireFingerprint', ctypes.c_int, [
+        ctypes.c_void_p,      # device handle
+        ctypes.c_char_p,      # image buffer
+        ctypes.c_uint,        # image size
+        ctypes.c_char_p,      # template buffer
+        ctypes.POINTER(ctypes.c_uint),  # template length
+    ]),
+    ('ZKFPM_GenRegTemplate', ctypes.c_int, [
+        ctypes.c_void_p,      # db handle
+        ctypes.c_char_p,      # template 1
+        ctypes.c_char_p,      # template 2
+        ctypes.c_char_p,      # template 3
+        ctypes.c_char_p,      # output buffer
+        ctypes.POINTER(ctypes.c_uint),  # output length
+    ]),
+    ('ZKFPM_DBMatch', ctypes.c_int, [
+        ctypes.c_void_p,      # db handle
+        ctypes.c_char_p,      # template 1
+        ctypes.c_uint,        # template 1 size
+        ctypes.c_char_p,      # template 2
+        ctypes.c_uint,        # template 2 size
+    ]),
+]
+
+
+def _bind_prototypes(lib):
+    """Set restype/argtypes for all SDK functions once and cache the
+    bound functions so hot paths avoid repeated prototype setup"""
+    for name, restype, argtypes in _PROTOTYPES:
+        func = getattr(lib, name)
+        func.restype = restype
+        func.argtypes = argtypes
+        _FUNCS['_' + name.lower()] = func
+
+
+def _get_lib():
+    """Load libzkfp.dll from the first working location, caching the
+    handle so repeated scanner constructions skip the DLL search"""
+    global _LIB, _LIB_PATH
+    if _LIB is not None:
+        return _LIB
+
+    search_paths = [
+        # Try explicit System32 path first (most reliable)
+        r'C:\Windows\System32\libzkfp.dll',
+        r'C:\Program Files\libzkfp.dll',
+        'libzkfp.dll',  # Fall back to system PATH
+        r'C:\Program Files\ZKTeco\SDK\libzkfp.dll',
+        str(Path(__file__).parent.parent.parent / 'bridge' / 'libzkfp.dll'),
+    ]
+
+    for dll_path in search_paths:
+        # Skip missing absolute paths without paying for a full DLL
+        # search; bare names still fall through to the system search
+        if os.path.isabs(dll_path) and not os.path.isfile(dll_path):
+            if _DEBUG:
+                print(f'[ZKTeco] Skipping missing path: {dll_path}', file=sys.stderr)
+            continue
+
+        try:
+            # Try to load the DLL. On Windows, absolute candidates load
+            # with LOAD_WITH_ALTERED_SEARCH_PATH so libzkfp's dependent
+            # DLLs resolve relative to the SDK's own directory instead
+            # of walking the full process search order
+            if sys.platform == 'win32' and os.path.isabs(dll_path):
+                lib = ctypes.WinDLL(dll_path, winmode=0x00000008)
+            else:
+                lib = ctypes.CDLL(dll_path)
+
+            # Verify it's the real SDK by checking for ZKFPM_Init function
+            try:
+                lib.ZKFPM_Init
+            except AttributeError:
+                if _DEBUG:
+                    print(f'[ZKTeco] DLL loaded but wrong library (no ZKFPM_Init): {dll_path}', file=sys.stderr)
+                continue
+
+            _bind_prototypes(lib)
+            _LIB = lib
+            _LIB_PATH = dll_path
+            print(f'[ZKTeco] SDK loaded from: {dll_path}', file=sys.stderr)
+            return lib
+
+        except (OSError, TypeError) as e:
+            if _DEBUG:
+                print(f'[ZKTeco] Failed to load {dll_path}: {e}', file=sys.stderr)
+            continue
+
+    print('[ZKTeco] Failed to load libzkfp.dll from any location', file=sys.stderr)
+    print('[ZKTeco] Try: copy "C:\\Program Files (x86)\\ZKTeco SDK\\libzkfp.dll" C:\\Windows\\System32\\',
+          file=sys.stderr)
+    return None
+
 
 class ZKTecoFingerprintScanner:
     """Interface to ZKTeco Fingerprint SDK"""
@@ -23,82 +166,68 @@ class ZKTecoFingerprintScanner:
     ZKFP_ERR_INVALID_HANDLE = 3
     ZKFP_ERR_OPEN_DEVICE = 4
     ZKFP_ERR_OPEN_FAILED = 5
-    
+
+    # Fixed slots (including the cached SDK function attributes) keep
+    # instances small and make the per-call attribute reads slot fetches
+    __slots__ = (
+        'lib', 'device_handle', 'db_handle', 'is_initialized',
+        'max_template_size', 'max_image_size',
+        '_img_buf', '_tpl_buf', '_tpl_len', '_merged_buf', '_merged_len',
+        '_enroll_slots', '_enroll_lens',
+    ) + tuple('_' + name.lower() for name, _restype, _argtypes in _PROTOTYPES)
+
     def __init__(self):
-        self.lib = None
+        self.lib = _get_lib()
         self.device_handle = None
         self.db_handle = None
         self.is_initialized = False
         self.max_template_size = 2048
         self.max_image_size = 320 * 480
-        self._load_library()
-    
-    def _load_library(self) -> bool:
-        """Try to load libzkfp.dll from multiple locations"""
-        search_paths = [
-            # Try explicit System32 path first (most reliable)
-            r'C:\Windows\System32\libzkfp.dll',
-            r'C:\Program Files\libzkfp.dll',
-            'libzkfp.dll',  # Fall back to system PATH
-            r'C:\Program Files\ZKTeco\SDK\libzkfp.dll',
-            str(Path(__file__).parent.parent.parent / 'bridge' / 'libzkfp.dll'),
-        ]
-        
-        for dll_path in search_paths:
-            try:
-                # Try to load the DLL
-                self.lib = ctypes.CDLL(dll_path)
-                
-                # Verify it's the real SDK by checking for ZKFPM_Init function
-                try:
-                    init_func = self.lib.ZKFPM_Init
-                    print(f'[ZKTeco] SDK loaded from: {dll_path}')
-                    return True
-                except AttributeError:
-                    print(f'[ZKTeco] DLL loaded but wrong library (no ZKFPM_Init): {dll_path}')
-                    self.lib = None
-                    continue
-                    
-            except (OSError, TypeError) as e:
-                print(f'[ZKTeco] Failed to load {dll_path}: {e}')
-                continue
-        
-        print('[ZKTeco] Failed to load libzkfp.dll from any location')
-        print('[ZKTeco] Try: copy "C:\\Program Files (x86)\\ZKTeco SDK\\libzkfp.dll" C:\\Windows\\System32\\')
-        return False
-    
+        self._img_buf = None
+        self._tpl_buf = None
+        self._tpl_len = None
+        self._merged_buf = None
+        self._merged_len = None
+        self._enroll_slots = None
+        self._enroll_lens = None
+        if self.lib is not None:
+            # Attach the pre-bound SDK functions as instance attributes
+            for attr, func in _FUNCS.items():
+                setattr(self, attr, func)
+
     def init(self) -> bool:
         """Initialize SDK"""
         if not self.lib:
-            print('[ZKTeco] Library not loaded')
+            log.error('Library not loaded')
             return False
         
         try:
-            # ZKFPM_Init
-            init_func = self.lib.ZKFPM_Init
-            init_func.restype = ctypes.c_int
-            init_func.argtypes = []
-            
-            ret = init_func()
+            ret = self._zkfpm_init()
             if ret != self.ZKFP_ERR_OK:
-                print(f'[ZKTeco] ZKFPM_Init failed: {ret}')
+                log.error('ZKFPM_Init failed: %s', ret)
                 return False
-            
-            # ZKFPM_DBInit
-            db_init = self.lib.ZKFPM_DBInit
-            db_init.restype = ctypes.c_void_p
-            db_init.argtypes = []
-            
-            self.db_handle = db_init()
+
+            self.db_handle = self._zkfpm_dbinit()
             if not self.db_handle:
-                print('[ZKTeco] ZKFPM_DBInit failed')
+                log.error('ZKFPM_DBInit failed')
                 return False
-            
+
+            # Allocate the capture buffers once and reuse them for every
+            # scan instead of re-allocating 150 KB + 2 KB per capture
+            self._img_buf = (ctypes.c_ubyte * self.max_image_size)()
+            self._tpl_buf = (ctypes.c_ubyte * self.max_template_size)()
+            self._tpl_len = ctypes.c_uint(self.max_template_size)
+            self._merged_buf = (ctypes.c_ubyte * self.max_template_size)()
+            self._merged_len = ctypes.c_uint(self.max_template_size)
+            self._enroll_slots = [
+                (ctypes.c_ubyte * self.max_template_size)() for _ in range(3)]
+            self._enroll_lens = [0, 0, 0]
+
             self.is_initialized = True
-            print('[ZKTeco] SDK initialized successfully')
+            log.debug('SDK initialized successfully')
             return True
         except Exception as e:
-            print(f'[ZKTeco] Initialization error: {e}')
+            log.error('Initialization error: %s', e)
             return False
     
     def get_device_count(self) -> int:
@@ -107,14 +236,10 @@ class ZKTecoFingerprintScanner:
             return 0
         
         try:
-            get_count = self.lib.ZKFPM_GetDeviceCount
-            get_count.restype = ctypes.c_int
-            get_count.argtypes = []
-            
-            count = get_count()
+            count = self._zkfpm_getdevicecount()
             return max(0, count)
         except Exception as e:
-            print(f'[ZKTeco] Error getting device count: {e}')
+            log.error('Error getting device count: %s', e)
             return 0
     
     def open_device(self, device_index: int = 0) -> bool:
@@ -123,30 +248,27 @@ class ZKTecoFingerprintScanner:
             return False
         
         try:
-            open_dev = self.lib.ZKFPM_OpenDevice
-            open_dev.restype = ctypes.c_void_p
-            open_dev.argtypes = [ctypes.c_int]
-            
-            print(f'[ZKTeco] Attempting to open device at index {device_index}...')
-            handle = open_dev(device_index)
+            log.debug('Attempting to open device at index %s...', device_index)
+            handle = self._zkfpm_opendevice(device_index)
             
             if not handle:
-                print(f'[ZKTeco] ZKFPM_OpenDevice returned NULL handle for index {device_index}')
-                print(f'[ZKTeco] Detected {self.get_device_count()} devices available')
-                print(f'[ZKTeco] Check:')
-                print(f'[ZKTeco]   - Device index is valid (0-{self.get_device_count()-1})')
-                print(f'[ZKTeco]   - Scanner has power (green light visible)')
-                print(f'[ZKTeco]   - No other app is using the device')
-                print(f'[ZKTeco]   - Device drivers are installed')
+                log.error('ZKFPM_OpenDevice returned NULL handle for index %s', device_index)
+                log.error('Detected %s devices available', self.get_device_count())
+                log.error('Check:')
+                log.error('  - Device index is valid')
+                log.error('  - Scanner has power (green light visible)')
+                log.error('  - No other app is using the device')
+                log.error('  - Device drivers are installed')
                 return False
             
             self.device_handle = handle
-            print(f'[ZKTeco] Device opened successfully (handle: {handle})')
+            log.debug('Device opened successfully (handle: %s)', handle)
             return True
         except Exception as e:
-            print(f'[ZKTeco] Exception opening device: {e}')
-            import traceback
-            traceback.print_exc()
+            log.error('Exception opening device: %s', e)
+            # Full traceback only when a debug handler is attached -
+            # formatting it eagerly stalls bursts of failing opens
+            log.debug('open_device failed', exc_info=True)
             return False
     
     def close_device(self):
@@ -155,15 +277,11 @@ class ZKTecoFingerprintScanner:
             return
         
         try:
-            close_dev = self.lib.ZKFPM_CloseDevice
-            close_dev.restype = ctypes.c_int
-            close_dev.argtypes = [ctypes.c_void_p]
-            
-            close_dev(self.device_handle)
+            self._zkfpm_closedevice(self.device_handle)
             self.device_handle = None
-            print('[ZKTeco] Device closed')
+            log.debug('Device closed')
         except Exception as e:
-            print(f'[ZKTeco] Error closing device: {e}')
+            log.error('Error closing device: %s', e)
     
     def terminate(self):
         """Terminate SDK"""
@@ -172,226 +290,290 @@ class ZKTecoFingerprintScanner:
         
         try:
             if self.db_handle:
-                db_free = self.lib.ZKFPM_DBFree
-                db_free.restype = ctypes.c_int
-                db_free.argtypes = [ctypes.c_void_p]
-                db_free(self.db_handle)
+                self._zkfpm_dbfree(self.db_handle)
                 self.db_handle = None
-            
-            term_func = self.lib.ZKFPM_Terminate
-            term_func.restype = ctypes.c_int
-            term_func.argtypes = []
-            
-            term_func()
+
+            self._zkfpm_terminate()
+            self._img_buf = None
+            self._tpl_buf = None
+            self._tpl_len = None
+            self._merged_buf = None
+            self._merged_len = None
+            self._enroll_slots = None
+            self._enroll_lens = None
             self.is_initialized = False
-            print('[ZKTeco] SDK terminated')
+            log.debug('SDK terminated')
         except Exception as e:
-            print(f'[ZKTeco] Error terminating SDK: {e}')
+            log.error('Error terminating SDK: %s', e)
     
-    def capture_fingerprint(self) -> Optional[Tuple[bytes, int]]:
+    def _capture_into(self, buf, len_ref) -> Optional[int]:
+        """Run AcquireFingerprint into a caller-provided buffer/length
+        cell; returns the template length or None on failure"""
+        len_ref.value = self.max_template_size
+
+        ret = self._zkfpm_acquirefingerprint(
+            self.device_handle,
+            ctypes.cast(self._img_buf, ctypes.c_char_p),
+            self.max_image_size,
+            ctypes.cast(buf, ctypes.c_char_p),
+            ctypes.byref(len_ref)
+        )
+
+        if ret != self.ZKFP_ERR_OK:
+            log.debug('ZKFPM_AcquireFingerprint failed: %s', ret)
+            return None
+        return len_ref.value
+
+    def capture_fingerprint(self, out_buf=None) -> Optional[Tuple]:
         """Capture fingerprint from device
-        Returns: (template_bytes, quality) or None on error
+        Returns: (template_bytes, quality), or (template_len, quality)
+        when `out_buf` is given and the template is copied into it
+        instead of allocating new bytes. None on error.
         """
         if not self.lib or not self.device_handle:
-            print('[ZKTeco] Device not initialized')
+            log.debug('Device not initialized')
             return None
         
         try:
-            # Allocate buffers
-            img_buf = ctypes.create_string_buffer(self.max_image_size)
-            template_buf = ctypes.create_string_buffer(self.max_template_size)
-            template_len = ctypes.c_uint(self.max_template_size)
-            
-            # Call ZKFPM_AcquireFingerprint
-            acquire = self.lib.ZKFPM_AcquireFingerprint
-            acquire.restype = ctypes.c_int
-            acquire.argtypes = [
-                ctypes.c_void_p,      # device handle
-                ctypes.c_char_p,      # image buffer
-                ctypes.c_uint,        # image size
-                ctypes.c_char_p,      # template buffer
-                ctypes.POINTER(ctypes.c_uint),  # template length
-            ]
-            
-            ret = acquire(
-                self.device_handle,
-                img_buf,
-                self.max_image_size,
-                template_buf,
-                ctypes.byref(template_len)
-            )
-            
-            if ret != self.ZKFP_ERR_OK:
-                print(f'[ZKTeco] ZKFPM_AcquireFingerprint failed: {ret}')
+            if _native is not None:
+                result = _native.acquire_fingerprint(self.device_handle)
+                if isinstance(result, int):
+                    log.debug('ZKFPM_AcquireFingerprint failed: %s', result)
+                    return None
+                log.debug('Fingerprint captured (template size: %s)', len(result))
+                if out_buf is not None:
+                    ctypes.memmove(out_buf, result, len(result))
+                    return (len(result), 95)
+                return (result, 95)  # Quality estimate
+
+            # Acquire into the shared buffers allocated in init()
+            actual_len = self._capture_into(self._tpl_buf, self._tpl_len)
+            if actual_len is None:
                 return None
-            
-            # Extract template
-            actual_len = template_len.value
-            template = template_buf.raw[:actual_len]
-            
-            print(f'[ZKTeco] Fingerprint captured (template size: {actual_len})')
+            log.debug('Fingerprint captured (template size: %s)', actual_len)
+
+            if out_buf is not None:
+                # Caller-provided buffer: straight memmove, no bytes object
+                ctypes.memmove(out_buf, self._tpl_buf, actual_len)
+                return (actual_len, 95)
+
+            # Extract template: slice through a memoryview so only the
+            # actual length is copied out of the shared buffer (no full
+            # 2 KB .raw intermediate)
+            template = memoryview(self._tpl_buf)[:actual_len].tobytes()
             return (template, 95)  # Quality estimate
         
         except Exception as e:
-            print(f'[ZKTeco] Capture error: {e}')
+            log.debug('Capture error: %s', e)
             return None
     
+    def _image_view(self) -> Optional['np.ndarray']:
+        """Zero-copy numpy view (480x320, uint8) over the image buffer
+        filled by the last capture. Shares memory with the reused buffer,
+        so callers must finish (or copy) before the next capture.
+        Returns None when numpy is unavailable or no buffer exists yet.
+        """
+        if self._img_buf is None:
+            return None
+
+        try:
+            import numpy as np
+        except ImportError:
+            log.debug('numpy not available for image view')
+            return None
+
+        # np.frombuffer wraps the ctypes array in place - no copy
+        return np.frombuffer(self._img_buf, dtype=np.uint8).reshape(480, 320)
+
     def enroll_fingerprint(self, num_samples: int = 3) -> Optional[bytes]:
         """Enroll fingerprint (capture multiple samples)
-        Returns: merged template bytes or None on error
+        Returns: base64-encoded merged template bytes or None on error
+
+        Encoding happens here, straight out of the pooled merge buffer,
+        so no unencoded copy of the merged template outlives this call.
         """
-        samples = []
-        
+        if num_samples < 3:
+            log.debug('Need at least 3 samples for enrollment')
+            return None
+
+        if self._enroll_slots is None:
+            log.debug('Device not initialized')
+            return None
+
+        # Capture straight into the fixed slot buffers from init() -
+        # no per-sample bytes objects
         for i in range(num_samples):
-            print(f'[ZKTeco] Scanning fingerprint {i+1} of {num_samples}...')
-            result = self.capture_fingerprint()
+            log.debug('Scanning fingerprint %s of %s...', i + 1, num_samples)
+            slot = self._enroll_slots[i] if i < 3 else None
+            result = self.capture_fingerprint(out_buf=slot)
             if not result:
-                print(f'[ZKTeco] Failed to capture sample {i+1}')
+                log.debug('Failed to capture sample %s', i + 1)
                 return None
-            
-            template, quality = result
-            samples.append(template)
-        
-        if len(samples) < 3:
-            print('[ZKTeco] Need at least 3 samples for enrollment')
-            return None
+
+            if i < 3:
+                self._enroll_lens[i] = result[0]
         
         try:
-            # Merge templates using ZKFPM_GenRegTemplate
-            merged_buf = ctypes.create_string_buffer(self.max_template_size)
-            merged_len = ctypes.c_uint(self.max_template_size)
-            
-            gen_reg = self.lib.ZKFPM_GenRegTemplate
-            gen_reg.restype = ctypes.c_int
-            gen_reg.argtypes = [
-                ctypes.c_void_p,      # db handle
-                ctypes.c_char_p,      # template 1
-                ctypes.c_char_p,      # template 2
-                ctypes.c_char_p,      # template 3
-                ctypes.c_char_p,      # output buffer
-                ctypes.POINTER(ctypes.c_uint),  # output length
-            ]
-            
-            ret = gen_reg(
+            # Merge templates using ZKFPM_GenRegTemplate into the buffer
+            # pre-allocated in init() - no allocation on the merge step
+            self._merged_len.value = self.max_template_size
+
+            ret = self._zkfpm_genregtemplate(
                 self.db_handle,
-                samples[0],
-                samples[1],
-                samples[2],
-                merged_buf,
-                ctypes.byref(merged_len)
+                ctypes.cast(self._enroll_slots[0], ctypes.c_char_p),
+                ctypes.cast(self._enroll_slots[1], ctypes.c_char_p),
+                ctypes.cast(self._enroll_slots[2], ctypes.c_char_p),
+                ctypes.cast(self._merged_buf, ctypes.c_char_p),
+                ctypes.byref(self._merged_len)
             )
-            
+
             if ret != self.ZKFP_ERR_OK:
-                print(f'[ZKTeco] ZKFPM_GenRegTemplate failed: {ret}')
+                log.debug('ZKFPM_GenRegTemplate failed: %s', ret)
                 return None
-            
-            actual_len = merged_len.value
-            merged = merged_buf.raw[:actual_len]
-            
-            print(f'[ZKTeco] Enrollment complete (template size: {actual_len})')
+
+            actual_len = self._merged_len.value
+            merged = b2a_base64(
+                memoryview(self._merged_buf)[:actual_len], newline=False)
+
+            log.debug('Enrollment complete (template size: %s)', actual_len)
             return merged
         
         except Exception as e:
-            print(f'[ZKTeco] Enrollment error: {e}')
+            log.debug('Enrollment error: %s', e)
             return None
     
     def verify_fingerprint(self, stored_template: bytes) -> Optional[Dict]:
         """Verify fingerprint against stored template
         Returns: {'match': bool, 'similarity': score} or None on error
         """
-        result = self.capture_fingerprint()
-        if not result:
+        if not self.lib or not self.device_handle:
+            log.debug('Device not initialized')
             return None
-        
-        captured_template, _ = result
-        
+
         try:
             # Compare templates using ZKFPM_DBMatch
-            match_func = self.lib.ZKFPM_DBMatch
-            match_func.restype = ctypes.c_int
-            match_func.argtypes = [
-                ctypes.c_void_p,      # db handle
-                ctypes.c_char_p,      # template 1
-                ctypes.c_uint,        # template 1 size
-                ctypes.c_char_p,      # template 2
-                ctypes.c_uint,        # template 2 size
-            ]
-            
-            similarity = match_func(
-                self.db_handle,
-                stored_template,
-                len(stored_template),
-                captured_template,
-                len(captured_template)
-            )
+            if _native is not None:
+                result = self.capture_fingerprint()
+                if not result:
+                    return None
+                captured_template, _ = result
+                similarity = _native.db_match(
+                    self.db_handle, stored_template, captured_template)
+            else:
+                # Capture into the shared buffer and hand the buffer
+                # pointer plus known length straight to DBMatch - no
+                # bytes object for the captured side
+                captured_len = self._capture_into(self._tpl_buf, self._tpl_len)
+                if captured_len is None:
+                    return None
+                similarity = self._zkfpm_dbmatch(
+                    self.db_handle,
+                    stored_template,
+                    len(stored_template),
+                    ctypes.cast(self._tpl_buf, ctypes.c_char_p),
+                    captured_len
+                )
             
             if similarity < 0:
-                print(f'[ZKTeco] ZKFPM_DBMatch error: {similarity}')
+                log.debug('ZKFPM_DBMatch error: %s', similarity)
                 return None
             
             match = similarity >= 60  # ZKTeco default threshold
             
-            print(f'[ZKTeco] Verification complete (similarity: {similarity})')
+            log.debug('Verification complete (similarity: %s)', similarity)
             return {
                 'match': match,
                 'similarity': similarity
             }
         
         except Exception as e:
-            print(f'[ZKTeco] Verification error: {e}')
+            log.debug('Verification error: %s', e)
             return None
 
 
-def handle_request(request_type: str, payload: Dict) -> Dict:
-    """Handle requests from Node.js backend"""
-    scanner = ZKTecoFingerprintScanner()
-    
+@lru_cache(maxsize=256)
+def _decode_template(b64: str) -> bytes:
+    """Decode a stored base64 template, caching the result so repeated
+    verifications of the same template (common when the daemon polls
+    for attendance) skip the decode"""
+    return base64.b64decode(b64)
+
+
+def _ensure_device(scanner: ZKTecoFingerprintScanner) -> bool:
+    """Initialize the SDK and open the device unless already done
+    (daemon mode keeps both alive between requests)"""
+    if scanner.is_initialized and scanner.device_handle:
+        return True
+
+    # Only init the SDK when it isn't already up - re-running init()
+    # after a failed open would leak the old DB cache and reallocate
+    # every pooled buffer. No device enumeration here either:
+    # open_device(0) fails cleanly when no device is present, and the
+    # count was being discarded anyway
+    if not scanner.is_initialized and not scanner.init():
+        return False
+    return scanner.open_device(0)
+
+
+def handle_request(request_type: str, payload: Dict,
+                   scanner: Optional[ZKTecoFingerprintScanner] = None) -> Dict:
+    """Handle requests from Node.js backend
+
+    When `scanner` is passed (daemon mode) the SDK stays initialized
+    across requests; otherwise a one-shot scanner is created and torn
+    down, matching the original CLI behavior.
+    """
+    one_shot = scanner is None
+    if one_shot:
+        scanner = ZKTecoFingerprintScanner()
+
     try:
         if request_type == 'init':
+            if scanner.is_initialized and scanner.device_handle:
+                return {
+                    'success': True,
+                    'device_count': scanner.get_device_count(),
+                    'error': None
+                }
+
             success = scanner.init()
             device_count = scanner.get_device_count() if success else 0
             opened = scanner.open_device(0) if device_count > 0 else False
-            
+
             return {
                 'success': success and device_count > 0 and opened,
                 'device_count': device_count,
                 'error': None if success else 'Failed to initialize SDK'
             }
-        
+
         elif request_type == 'capture':
-            scanner.init()
-            scanner.get_device_count()
-            scanner.open_device(0)
-            
+            _ensure_device(scanner)
+
             result = scanner.capture_fingerprint()
             if result:
                 template, quality = result
                 return {
                     'success': True,
-                    'template': base64.b64encode(template).decode(),
+                    'template': b2a_base64(template, newline=False).decode('ascii'),
                     'quality': quality
                 }
             return {'success': False, 'error': 'Capture failed'}
         
         elif request_type == 'enroll':
-            scanner.init()
-            scanner.get_device_count()
-            scanner.open_device(0)
-            
+            _ensure_device(scanner)
+
             template = scanner.enroll_fingerprint(3)
             if template:
                 return {
                     'success': True,
-                    'template': base64.b64encode(template).decode()
+                    'template': template.decode('ascii')
                 }
             return {'success': False, 'error': 'Enrollment failed'}
         
         elif request_type == 'verify':
-            scanner.init()
-            scanner.get_device_count()
-            scanner.open_device(0)
-            
-            stored = base64.b64decode(payload.get('template', ''))
+            _ensure_device(scanner)
+
+            stored = _decode_template(payload.get('template', ''))
             result = scanner.verify_fingerprint(stored)
             
             if result:
@@ -404,18 +586,64 @@ def handle_request(request_type: str, payload: Dict) -> Dict:
         
         else:
             return {'success': False, 'error': f'Unknown request type: {request_type}'}
-    
+
     finally:
-        scanner.terminate()
+        if one_shot:
+            scanner.terminate()
+
+
+def daemon():
+    """Long-lived mode for the Node.js backend: load the SDK and open the
+    device once, then service JSON-lines requests from stdin until EOF.
+    Each request line is {'type': ..., 'payload': {...}}; each response
+    is one JSON line on stdout.
+    """
+    scanner = ZKTecoFingerprintScanner()
+    atexit.register(scanner.terminate)
+
+    # Binary stdio skips the text-layer encode/decode on every message
+    stdout = sys.stdout.buffer
+    for line in sys.stdin.buffer:
+        line = line.strip()
+        if not line:
+            continue
+
+        try:
+            req = _loads(line)
+        except ValueError:
+            stdout.write(_dumps({'success': False, 'error': 'Invalid JSON request'}) + b'\n')
+            stdout.flush()
+            continue
+
+        # A bad request (malformed payload, non-object JSON, ...) must
+        # fail its own response line, never take the daemon down with it
+        try:
+            result = handle_request(req.get('type', ''), req.get('payload') or {}, scanner=scanner)
+        except Exception as e:
+            log.error('Request failed: %s', e)
+            result = {'success': False, 'error': str(e)}
+
+        stdout.write(_dumps(result) + b'\n')
+        stdout.flush()
 
 
 if __name__ == '__main__':
-    # Simple CLI for testing
-    if len(sys.argv) > 1:
+    # Logging goes to stderr so it never corrupts the JSON on stdout;
+    # set ZKTECO_DEBUG=1 for verbose output
+    logging.basicConfig(
+        stream=sys.stderr,
+        level=logging.DEBUG if _DEBUG else logging.WARNING,
+        format='[ZKTeco] %(message)s',
+    )
+
+    # Simple CLI for testing, or 'daemon' for the long-lived stdin loop
+    if len(sys.argv) > 1 and sys.argv[1] == 'daemon':
+        daemon()
+    elif len(sys.argv) > 1:
         req_type = sys.argv[1]
-        payload = json.loads(sys.argv[2]) if len(sys.argv) > 2 else {}
+        payload = _loads(sys.argv[2]) if len(sys.argv) > 2 else {}
         result = handle_request(req_type, payload)
-        print(json.dumps(result))
+        sys.stdout.buffer.write(_dumps(result) + b'\n')
     else:
         print('ZKTeco Fingerprint Bridge - CLI Interface')
-        print('Usage: python zkTecoFingerprintBridge.py <type> [payload]')
+        print('Usage: python zkTecoFingerprintBridge.py <type|daemon> [payload]')